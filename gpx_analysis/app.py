@@ -19,12 +19,14 @@ try:
     from gpx_analysis.gui import AppGUI
     from gpx_analysis import sporting as sport
     from gpx_analysis import components as geo
+    from gpx_analysis import tile_handler as tiles
 except ImportError:
     import gpx_parser as gpx
     import graph_handler as gh
     from gui import AppGUI
     import sporting as sport
     import components as geo
+    import tile_handler as tiles
 
 
 class GpxAnalysisApp:
@@ -37,6 +39,9 @@ class GpxAnalysisApp:
         Constructor for GpxAnalysisApp
         """
 
+        # get a connection to the tile server going while everything else loads
+        tiles.warm_up_tile_server()
+
         # Instantiate the important 2 mpl helper classes, MapClass and TODO statsGraph
         self.__mpl_map = gh.MapClass()
 
@@ -265,10 +270,8 @@ class GpxAnalysisApp:
         clean_path = f'/{path.parent.name}/{path.name}'
 
         # calculate stats for athlete speed throughout the track
-        speed_data = []
-        for track_point in new_track.get_track_points():
-            speed_data.append(sport.get_speed_at_time(new_track, track_point.time))
-        speed_data = np.array(speed_data)
+        speed_data = np.array([sport.get_speed_at_time(new_track, point_time)
+                               for point_time in new_track.get_relative_times()])
         speed_mean = np.mean(speed_data)
         speed_max = np.max(speed_data)
         speed_std = np.std(speed_data)
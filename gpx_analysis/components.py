@@ -4,6 +4,7 @@ This file contains functions used for doing geographic calculations
 import math
 from copy import deepcopy
 import colorsys
+import numpy as np
 import matplotlib.colors
 
 try:
@@ -33,6 +34,27 @@ def geo_distance(latitude1: float, longitude1: float, latitude2: float, longitud
     return radius * c_val * 1000  # meters
 
 
+def geo_distance_vec(latitude1: np.ndarray, longitude1: np.ndarray,
+                     latitude2: np.ndarray, longitude2: np.ndarray) -> np.ndarray:
+    """
+    The same as geo_distance but works on whole arrays of points at once
+
+    :param latitude1: The latitudes of the first points
+    :param longitude1: The longitudes of the first points
+    :param latitude2: The latitudes of the second points
+    :param longitude2: The longitudes of the second points
+    :return: The distances between each pair of points in meters
+    """
+
+    radius = 6378.137  # Radius of earth in KM
+    lat1_rad, lat2_rad = np.radians(latitude1), np.radians(latitude2)
+    d_lat = lat2_rad - lat1_rad
+    d_lon = np.radians(longitude2) - np.radians(longitude1)
+    a_val = np.sin(d_lat / 2) ** 2 + np.cos(lat1_rad) * np.cos(lat2_rad) * np.sin(d_lon / 2) ** 2
+    c_val = 2 * np.arctan2(np.sqrt(a_val), np.sqrt(1 - a_val))
+    return radius * c_val * 1000  # meters
+
+
 def standardise_gpx_distances(input_track: gpx.Track) -> gpx.Track:
     """
     This function converts the original (lat lon) distances in the track into meters
@@ -73,10 +95,13 @@ def get_track_bounds(input_track: gpx.Track) -> tuple:
     # Get the bottom left of the track
     all_track_points = input_track.get_track_points()
 
-    west = min(i.get_position_degrees()[0] for i in all_track_points)
-    south = min(i.get_position_degrees()[1] for i in all_track_points)
-    east = max(i.get_position_degrees()[0] for i in all_track_points)
-    north = max(i.get_position_degrees()[1] for i in all_track_points)
+    # fetch each position once then split it into the two coordinates
+    first_coords, second_coords = zip(*[i.get_position_degrees() for i in all_track_points])
+
+    west = min(first_coords)
+    south = min(second_coords)
+    east = max(first_coords)
+    north = max(second_coords)
 
     return north, east, south, west
 
@@ -5,6 +5,7 @@ This module parses a GPX file into the track class which is made up of track poi
 
 import xml.etree.ElementTree as ET
 from datetime import datetime
+import numpy as np
 
 
 class TrackPoint:
@@ -125,8 +126,12 @@ class Track:
         self.__track_points = []
         self.__create_track_points()
 
+        self.__relative_times = None
         self.__redo_timings()
 
+        # Distance travelled up to each point, filled in lazily by the sporting module
+        self.__cumulative_distances = None
+
         self.__has_cadence = False
 
     def get_filename(self) -> str:
@@ -196,6 +201,11 @@ class Track:
         for point in self.__track_points:
             point.set_relative_time((point.formatted_time - min_time).total_seconds())
 
+        # Keep the times in an array too so lookups by time can binary search it
+        self.__relative_times = np.fromiter((point.get_relative_time()
+                                             for point in self.__track_points),
+                                            dtype=np.float64, count=len(self.__track_points))
+
     def get_track_points(self) -> list[TrackPoint]:
         """
         Getter for track points
@@ -204,6 +214,31 @@ class Track:
         """
         return self.__track_points
 
+    def get_relative_times(self) -> np.ndarray:
+        """
+        Getter for the relative times of all the track points
+
+        :return: Array of the relative time of each track point (ascending)
+        """
+        return self.__relative_times
+
+    def get_cumulative_distances(self) -> np.ndarray | None:
+        """
+        Getter for the cached cumulative distances
+
+        :return: Array of the distance travelled up to each track point or None if not calculated
+        """
+        return self.__cumulative_distances
+
+    def set_cumulative_distances(self, cumulative_distances: np.ndarray) -> None:
+        """
+        Setter for the cached cumulative distances
+
+        :param cumulative_distances: Array of the distance travelled up to each track point
+        :return: None
+        """
+        self.__cumulative_distances = cumulative_distances
+
     def get_has_cadence(self) -> bool:
         """
         Getter for has_cadence
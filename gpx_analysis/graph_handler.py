@@ -1,163 +1,37 @@
 """
-This module handles the graphing of the GPX file and the fetching of OSM tiles
+This module handles the graphing of the GPX file onto the map of OSM tiles
 """
 # pylint: disable=R0902
 
-import math
-import urllib.request
-import io
-import os.path
+import asyncio
 from sys import platform as sys_pf
-import PIL.Image
 import numpy as np
-from appdirs import user_data_dir
 
 import matplotlib
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
+from matplotlib.collections import LineCollection
 
 try:
     from gpx_analysis import components as geo
     from gpx_analysis import gpx_parser as gpx
     from gpx_analysis import sporting as sport
+    from gpx_analysis import tile_handler as tiles
 except ImportError:
     import components as geo
     import gpx_parser as gpx
     import sporting as sport
+    import tile_handler as tiles
 
 # If we are on macos then run this to fix the issues
 if sys_pf == 'darwin':
     matplotlib.use("TkAgg")
 
-
-def deg2num(lat_deg: float, lon_deg: float, zoom: int) -> tuple[int, int]:
-    """
-    Code for converting lat lon to tile number from
-    https://wiki.openstreetmap.org/wiki/Slippy_map_tilenames
-
-    :param lat_deg: Input latitude
-    :param lon_deg: Input longitude
-    :param zoom: OSM zoom level
-    :return: the OSM tile position
-    """
-    lat_rad = math.radians(lat_deg)
-    exp_zoom = 2.0 ** zoom
-    xtile = int((lon_deg + 180.0) / 360.0 * exp_zoom)
-    ytile = int((1.0 - math.log(math.tan(lat_rad) +
-                                (1 / math.cos(lat_rad))) / math.pi) / 2.0 * exp_zoom)
-    return xtile, ytile
-
-
-def num2deg(xtile: int, ytile: int, zoom: int) -> tuple[float, float]:
-    """
-    Code for converting tile number to lat lon from
-    https://wiki.openstreetmap.org/wiki/Slippy_map_tilenames
-
-    :param xtile: The tile x coordinate
-    :param ytile: The tile y corrdinate
-    :param zoom: The osm zoom level
-    :return: (latitude, longitude)
-    """
-    exp_zoom = 2.0 ** zoom
-    lon_deg = xtile / exp_zoom * 360.0 - 180.0
-    lat_rad = math.atan(math.sinh(math.pi * (1 - 2 * ytile / exp_zoom)))
-    lat_deg = math.degrees(lat_rad)
-    return lat_deg, lon_deg
-
-
-def get_img(x_coord: int, y_coord: int, zoom: int):
-    """
-    Get the image from the tile either from cache or downloading
-
-    :param x_coord: The x tile index
-    :param y_coord: The y tile index
-    :param zoom: The zoom tile index
-    :return: The image
-    """
-
-    # get the app data path and add the image cache folder on
-
-    app_data_path = user_data_dir("GPX Analysis", 'edf1101')
-    image_cache_dir = os.path.join(app_data_path, 'image_cache')
-
-    # create the image cache if it doesn't already exist
-    if not os.path.exists(image_cache_dir):
-        os.makedirs(image_cache_dir)
-
-    # Check if its cached first
-    endings = ['jpg', 'jpeg', 'png']  # the acceptable filetypes to use
-    img = None
-    for f_type in endings:
-        name = os.path.join(image_cache_dir, f'{zoom}-{y_coord}-{x_coord}.{f_type}')
-        if os.path.isfile(name):
-            img = PIL.Image.open(name)
-
-    if img is None:  # Otherwise download it and cache
-        image_url = (f'https://server.arcgisonline.com/ArcGIS/rest/services/'
-                     f'World_Topo_Map/MapServer/tile/{zoom}/{y_coord}/{x_coord}')
-        with urllib.request.urlopen(image_url) as response:
-            img = PIL.Image.open(io.BytesIO(response.read()))
-            path = os.path.join(image_cache_dir, f'{zoom}-{y_coord}-{x_coord}.jpg')
-            img.save(path)  # Save as jpg into cache folder
-
-    return img
-
-
-def get_all_images_in_bounds(bounds) -> dict[tuple, PIL.Image]:
-    """
-    Get all the images in the bounds and put them in a dictionary with their
-    tile index as the key
-
-    :param bounds:  The bounds of the track (NESW)
-    :return:  The collection of images as a dict key = image pos, value = image
-    """
-
-    bottom_left_tile_num = deg2num(bounds[3], bounds[2], 17)
-    top_right_tile_num = deg2num(bounds[1], bounds[0], 17)
-
-    tiles = {}
-    for x_coord in range(bottom_left_tile_num[0] - 1, top_right_tile_num[0] + 1):
-        for y_coord in range(top_right_tile_num[1] - 1, bottom_left_tile_num[1] + 1):
-            if (x_coord, y_coord) not in tiles:
-                tiles[(x_coord, y_coord)] = get_img(x_coord, y_coord, 17)
-
-    return tiles
-
-
-def get_all_images_near_track(track: gpx.Track) -> dict[tuple, PIL.Image]:
-    """
-    More Tile server friendly way of getting images, by only fetching the ones near the track
-
-    :param track: The track to get images of nearby
-    :return: The collection of images as a dict key = image pos, value = image
-    """
-
-    radius = 1
-
-    tiles = {}  # a dict of the tile indexes we have found
-
-    all_track_points = track.get_track_points()  # all the points we'll iterate through
-
-    for point in all_track_points:
-        pos = point.get_position_degrees()  # the point's degrees value
-        tile_ind = deg2num(pos[0], pos[1], 17)
-
-        # Look in a radius around this point
-        for x_pos in range(tile_ind[0] - radius, tile_ind[0] + radius + 1):
-            for y_pos in range(tile_ind[1] - radius, tile_ind[1] + radius + 1):
-
-                # skip this position if we have already fetched it
-                if (x_pos, y_pos) in tiles:
-                    continue
-
-                # check its within a smooth radius
-                mag_sqr = pow(x_pos - tile_ind[0], 2) + pow(y_pos - tile_ind[1], 2)
-                if mag_sqr > pow(radius + 0.5, 2):
-                    continue
-
-                tiles[(x_pos, y_pos)] = get_img(x_pos, y_pos, 17)
-
-    return tiles
+# The follow camera only re-centres once a boat gets closer to the edge of the view than
+# this fraction of the border, or once the boats only fill this fraction of the view.
+# In between the view stays still so the GUI can just blit the markers
+RECENTRE_MARGIN = 0.5
+MIN_VIEW_FILL = 0.7
 
 
 class MapClass:
@@ -173,13 +47,24 @@ class MapClass:
         self.tile_size = 50
         self.__image_dict = {}
         self.__raw_image_dict = {}
+        self.__plotted_tiles = set()  # the (reindexed) tiles already drawn onto the axes
+        self.__view = None  # the (left, right, down, up) view last set, None means show it all
+        self.__view_offset = None  # the border used when the view was last centered
+        self.__tiles_pending = False  # whether tiles were added that might still need plotting
 
         self.gpx_bounds_deg = None
         self.tile_bounds_plt = None
         self.tile_bounds_deg = None
+        self.__tile_ind_bounds = None  # the tile indexes at the (N, E, S, W) edges
+        self.__x_scale, self.__x_off = None, None  # degrees to graph conversion coefficients
+        self.__y_scale, self.__y_off = None, None
 
         self.__athletes = {}
 
+        # Whether anything other than the athlete markers has changed since the
+        # last full draw, if not the GUI can just blit the markers over the old background
+        self.scene_changed = True
+
     def reset(self) -> None:
         """
         Resets the map to a blank state
@@ -190,12 +75,17 @@ class MapClass:
         self.tile_size = 50
         self.__image_dict = {}
         self.__raw_image_dict = {}
+        self.__plotted_tiles = set()
+        self.__view = None
+        self.__view_offset = None
+        self.__tiles_pending = False
 
         self.gpx_bounds_deg = None
         self.tile_bounds_plt = None
         self.tile_bounds_deg = None
 
         self.__athletes = {}
+        self.scene_changed = True
 
         for axis in self.__fig.get_axes():
             axis.legend_ = None
@@ -206,6 +96,17 @@ class MapClass:
         """
         Add a track to the graph handler instance
 
+        :param athlete_key: The key that gets added to the dictionary (simple filename)
+        :param athlete_value: The dict of athlete data
+        :return: None
+        """
+        asyncio.run(self.add_athlete_async(athlete_key, athlete_value))
+
+    async def add_athlete_async(self, athlete_key: str, athlete_value: dict) -> None:
+        """
+        Add a track to the graph handler instance, fetching its tiles while
+        the track's data gets precomputed
+
         :param athlete_key: The key that gets added to the dictionary (simple filename)
         :param athlete_value: The dict of athlete data
         :return: None
@@ -216,15 +117,35 @@ class MapClass:
         new_bounds = geo.get_track_bounds(athlete_value['track'])
         self.__set_gpx_bounds(new_bounds)
 
-        # Redo the images for the graph handler with the new bounds
-        self.__add_images(get_all_images_near_track(athlete_value['track']))
+        # Start getting the tiles straight away, they're mostly waiting on the network
+        tile_task = asyncio.create_task(
+            tiles.get_all_images_near_track_async(athlete_value['track']))
 
-        self.__ax.cla()
-        self.plot_images()
-        for athlete in self.__athletes.values():
-            self.draw_track(athlete['filename'], athlete['colour'])
+        # meanwhile work out the track's cumulative distances (cached on the track so the
+        # stats don't have to later), it's CPU bound so do it off the event loop
+        await asyncio.get_running_loop().run_in_executor(None, sport.get_cumulative_distances,
+                                                         athlete_value['track'])
+
+        # Redo the images for the graph handler with the new bounds
+        old_tile_bounds = self.tile_bounds_deg
+        self.__add_images(await tile_task)
+
+        if self.tile_bounds_deg != old_tile_bounds:
+            # the tiles all shifted so everything has to be redrawn from scratch
+            self.__ax.cla()
+            self.__plotted_tiles = set()
+            self.__view = None
+            for athlete in self.__athletes.values():
+                self.draw_track(athlete['filename'], athlete['colour'])
+        else:
+            # Everything already drawn is still in the right place, so just add the new parts
+            self.draw_track(athlete_key, athlete_value['colour'])
         self.__draw_legend()
 
+        # The tiles get plotted by the next center_viewpoint, once we know what's in view,
+        # so tiles that end up out of view never get decoded
+        self.__tiles_pending = True
+
     def modify_athlete(self, athlete_key: str, new_value: dict) -> None:
         """
         gets called when an athlete changes something (either a colour or display name)
@@ -284,16 +205,16 @@ class MapClass:
         # update the legend
         self.__draw_legend()
 
-    def __add_images(self, _image_dict: dict[tuple[int, int], PIL.Image]) -> None:
+    def __add_images(self, _image_dict: dict[tuple[int, int], tiles.LazyTile]) -> None:
         """
         Set the image dictionary
 
         :param _image_dict: The image dictionary
         """
 
-        # Only add the new images to the dict
+        # Only add the new images to the dict, or fresh copies of ones which were broken
         for key, value in _image_dict.items():
-            if key not in self.__raw_image_dict:
+            if key not in self.__raw_image_dict or self.__raw_image_dict[key].is_broken():
                 self.__raw_image_dict[key] = value
 
         # recalibrate this dict
@@ -318,22 +239,32 @@ class MapClass:
         if not self.__raw_image_dict:
             raise ValueError("Image dictionary not set")
 
-        tile_indexes = self.__raw_image_dict.keys()
+        x_indexes, y_indexes = zip(*self.__raw_image_dict.keys())
 
         # North (min y val since it goes up as you go down on OSM tiles)
-        tile_ind_bounds = (min(i[1] for i in tile_indexes),  # north
-                           max(i[0] for i in tile_indexes),  # east
-                           max(i[1] for i in tile_indexes),  # south
-                           min(i[0] for i in tile_indexes))  # west
+        tile_ind_bounds = (min(y_indexes),  # north
+                           max(x_indexes),  # east
+                           max(y_indexes),  # south
+                           min(x_indexes))  # west
+        self.__tile_ind_bounds = tile_ind_bounds  # kept for reindexing the tiles
 
         self.tile_bounds_plt = ((tile_ind_bounds[2] - tile_ind_bounds[0] + 1) * self.tile_size,
                                 (tile_ind_bounds[1] - tile_ind_bounds[3] + 1) * self.tile_size,
                                 0, 0)
 
-        bottom_left = num2deg(tile_ind_bounds[3], tile_ind_bounds[2] + 1, 17)
-        top_right = num2deg(tile_ind_bounds[1] + 1, tile_ind_bounds[0], 17)
+        bottom_left = tiles.num2deg(tile_ind_bounds[3], tile_ind_bounds[2] + 1, 17)
+        top_right = tiles.num2deg(tile_ind_bounds[1] + 1, tile_ind_bounds[0], 17)
         self.tile_bounds_deg = (top_right[0], top_right[1], bottom_left[0], bottom_left[1])
 
+        # The degree to graph conversion is just a scale and offset on each axis, so work
+        # them out once here rather than on every conversion
+        self.__x_scale = (self.tile_bounds_plt[1] /
+                          (self.tile_bounds_deg[1] - self.tile_bounds_deg[3]))
+        self.__x_off = -self.tile_bounds_deg[3] * self.__x_scale
+        self.__y_scale = (self.tile_bounds_plt[0] /
+                          (self.tile_bounds_deg[0] - self.tile_bounds_deg[2]))
+        self.__y_off = -self.tile_bounds_deg[2] * self.__y_scale
+
     def __reindex_tiles(self) -> None:
         """
         Make it so the bottom left tile is (0, 0) and then as it goes up and right
@@ -341,14 +272,7 @@ class MapClass:
         """
         # Make sure we set tile bounds before we remove original tile indexes in this func
         self.__set_tile_bounds()
-
-        tile_indexes = self.__raw_image_dict.keys()
-
-        # North (min y val since it goes up as you go down on OSM tiles)
-        tile_ind_bounds = (min(i[1] for i in tile_indexes),  # north
-                           max(i[0] for i in tile_indexes),  # east
-                           max(i[1] for i in tile_indexes),  # south
-                           min(i[0] for i in tile_indexes))  # west
+        tile_ind_bounds = self.__tile_ind_bounds
 
         # Go through the dict and remake it with keys starting at (0, 0)
         new_dict = {}
@@ -360,15 +284,35 @@ class MapClass:
 
     def plot_images(self) -> None:
         """
-        Plots all the images in the image dictionary
+        Plots the images in the image dictionary that are in view and haven't been plotted yet
         :return: None
         """
+        self.scene_changed = True
 
         for tile_index, image in self.__image_dict.items():
-            self.__ax.imshow(np.asarray(image), extent=(tile_index[0] * self.tile_size,
-                                                        (tile_index[0] + 1) * self.tile_size,
-                                                        tile_index[1] * self.tile_size,
-                                                        (tile_index[1] + 1) * self.tile_size))
+            # broken tiles stay blank rather than trying to decode them again every time
+            if tile_index in self.__plotted_tiles or image.is_broken():
+                continue
+
+            extent = (tile_index[0] * self.tile_size, (tile_index[0] + 1) * self.tile_size,
+                      tile_index[1] * self.tile_size, (tile_index[1] + 1) * self.tile_size)
+
+            # Leave tiles out of view undecoded, they get plotted when the view moves onto them
+            if self.__view is not None and (extent[1] <= self.__view[0] or
+                                            extent[0] >= self.__view[1] or
+                                            extent[3] <= self.__view[2] or
+                                            extent[2] >= self.__view[3]):
+                continue
+
+            try:
+                pixels = image.to_array()
+            except OSError:  # a broken cache file, just leave it blank
+                continue
+
+            self.__ax.imshow(pixels, extent=extent)
+            self.__plotted_tiles.add(tile_index)
+
+        self.__tiles_pending = False
 
     def __remove_axis(self) -> None:
         """
@@ -390,6 +334,24 @@ class MapClass:
         # self.__fig.set_dpi(100)
         return self.__fig
 
+    def get_axes(self) -> plt.Axes:
+        """
+        Return the axes the map is drawn on
+
+        :return: The axes
+        """
+        return self.__ax
+
+    def get_point_artists(self) -> list[plt.Line2D]:
+        """
+        Return the athlete markers, these are animated so they get blitted
+        separately from the rest of the map
+
+        :return: A list of the marker artists currently drawn
+        """
+        return [athlete['draw_point'] for athlete in self.__athletes.values()
+                if athlete.get('draw_point') is not None]
+
     def scale_zoom(self, input_value: float) -> float:
         """
         This takes an input zoom level and scales it exponentially to be max
@@ -425,6 +387,12 @@ class MapClass:
         # convert all lat lon positions to x,y graph coords
         positions = [self.degrees_to_graph(pos) for pos in positions]
 
+        # Hold the view still while the boats are comfortably inside it
+        if self.__view_still_fits(positions, offset):
+            if self.__tiles_pending:
+                self.plot_images()
+            return
+
         # Get the highest and lowest position for the boats
         max_x, max_y = max(pos[0] for pos in positions), max(pos[1] for pos in positions)
         min_x, min_y = min(pos[0] for pos in positions), min(pos[1] for pos in positions)
@@ -445,7 +413,43 @@ class MapClass:
         right = min(center_x + graph_size / 2 + offset, self.tile_bounds_plt[1])
         down = max(0.0, center_y - graph_size / 2 - offset)
         above = min(center_y + graph_size / 2 + offset, self.tile_bounds_plt[0])
-        self.__ax.axis((left, right, down, above))
+
+        # only touch the axes if the view actually moves, so the background can be reused
+        if tuple(self.__ax.axis()) != (left, right, down, above):
+            self.__ax.axis((left, right, down, above))
+            self.scene_changed = True
+            self.__tiles_pending = True  # some tiles might have just come into view
+        self.__view = (left, right, down, above)
+        self.__view_offset = offset
+
+        # now plot any tiles which are in view but not plotted yet
+        if self.__tiles_pending:
+            self.plot_images()
+
+    def __view_still_fits(self, positions: list[tuple[float, float]], offset: float) -> bool:
+        """
+        Checks whether the current view can be kept rather than re-centering it. That's
+        when the zoom is the same, no boat is near the edge and the boats haven't bunched
+        up so much that the view is far too big for them
+
+        :param positions: A list of the (x,y) graph coordinates of the boats
+        :param offset: The scaled border around the boats
+        :return: Whether the view can stay as it is
+        """
+
+        if self.__view is None or offset != self.__view_offset:
+            return False
+
+        left, right, down, above = self.__view
+        margin = offset * RECENTRE_MARGIN
+        xs, ys = [pos[0] for pos in positions], [pos[1] for pos in positions]
+        if min(xs) < left + margin or max(xs) > right - margin:
+            return False
+        if min(ys) < down + margin or max(ys) > above - margin:
+            return False
+
+        needed_size = max(max(xs) - min(xs), max(ys) - min(ys)) + 2 * offset
+        return needed_size >= MIN_VIEW_FILL * max(right - left, above - down)
 
     def draw_track(self, athlete_key: str, color: str | tuple = 'green') -> None:
         """
@@ -460,39 +464,40 @@ class MapClass:
                 self.__athletes[athlete_key]['draw_track'] is not None):
             self.__remove_drawn_track(athlete_key)
 
+        self.scene_changed = True
         track = self.__athletes[athlete_key]['track']
         line_data = []
 
-        color_scheme = 'speed' if color == 'speed' else 'normal'
-        if color == 'speed':
-            speed_range = self.__athletes[athlete_key]['speed_range']  # get the acceptable speed range
-
-        for i in range(len(track.get_track_points()) - 1):
-            start_point = track.get_track_points()[i]  # get start and end points of line
-            end_point = track.get_track_points()[i + 1]
-
-            # dont plot this line if its out of the start finish zone
-            if (end_point.get_relative_time() < self.__athletes[athlete_key]['start_time'] or
-                    start_point.get_relative_time() > self.__athletes[athlete_key]['finish_time']):
-                continue
-
-            if color_scheme == 'speed':  # if the colour scheme is speed then calculate the new colour
-                speed = sport.get_speed_at_time(track, start_point.get_relative_time())
-                # make it grey if it's an outlier
-                if speed is None or speed < speed_range[0] :
-                    color = 'grey'
-                elif speed > speed_range[1]:
-                    color = (0, 1, 0)
-                else:
-                    # scale the speed to be between 0 and 1
-                    speed = (speed - speed_range[0]) / (speed_range[1] - speed_range[0])
-                    # lerp between red and green
-                    color = (1 - speed, speed, 0)
-
-            single_line = self.draw_line(start_point.get_position_degrees(),
-                                         end_point.get_position_degrees(),
-                                         color=color)
-            line_data.append(single_line)
+        track_points = track.get_track_points()
+        # convert the whole track to graph coordinates in one go rather than per segment
+        track_xy = self.degrees_to_graph_batch(
+            np.asarray([point.get_position_degrees() for point in track_points]))
+
+        # only plot the segments inside the start finish zone, as the times only go up
+        # these are always one contiguous run of segments
+        times = track.get_relative_times()
+        in_zone = np.flatnonzero((times[1:] >= self.__athletes[athlete_key]['start_time']) &
+                                 (times[:-1] <= self.__athletes[athlete_key]['finish_time']))
+
+        if len(in_zone) == 0:
+            self.__athletes[athlete_key]['draw_track'] = line_data
+            return
+
+        first_seg, last_seg = in_zone[0], in_zone[-1]
+
+        if color == 'speed':  # if the colour scheme is speed then each segment gets its own colour
+            colors = self.__segment_colours(track, first_seg, last_seg,
+                                            self.__athletes[athlete_key]['speed_range'])
+
+            # one collection holding every segment, rather than an artist per segment
+            segments = np.stack((track_xy[first_seg:last_seg + 1],
+                                 track_xy[first_seg + 1:last_seg + 2]), axis=1)
+            line_data.append(self.__ax.add_collection(
+                LineCollection(segments, colors=colors, linewidths=2, capstyle='projecting')))
+        else:
+            line_data.append(self.__ax.plot(track_xy[first_seg:last_seg + 2, 0],
+                                            track_xy[first_seg:last_seg + 2, 1],
+                                            color=color, linewidth=2)[0])
 
         self.__athletes[athlete_key]['draw_track'] = line_data
 
@@ -507,34 +512,43 @@ class MapClass:
         if ('draw_track' in self.__athletes[athlete_key] and
                 self.__athletes[athlete_key]['draw_track'] is not None):
 
-            # Go through the list of lines making up the track we drew and remove each
+            # Go through the list of artists making up the track we drew and remove each
             for line in self.__athletes[athlete_key]['draw_track']:
                 line.remove()
+            self.scene_changed = True
 
             # Set the list to be None at the end
             self.__athletes[athlete_key]['draw_track'] = None
 
-    def draw_line(self, start: tuple[float, float],
-                  end: tuple[float, float],
-                  color: str = 'green', width: int = 2) -> plt.Line2D:
+    @staticmethod
+    def __segment_colours(track: gpx.Track, first_seg: int, last_seg: int,
+                          speed_range: list[float]) -> list[str | tuple]:
         """
-        Draw a line on the graph
+        Work out the speed colour scheme colour of each segment of a track
 
-        :param start: tuple lat,lon coordinates
-        :param end: tuple lat,lon coordinates
-        :param color: colour of the point default green
-        :param width: width of the line default 2
-        :return: the line data
+        :param track: The track the segments are on
+        :param first_seg: The index of the first segment to colour
+        :param last_seg: The index of the last segment to colour (inclusive)
+        :param speed_range: The acceptable (min, max) speed range, outside it is an outlier
+        :return: A colour for each segment
         """
+        times = track.get_relative_times()
 
-        start_graph_pos = self.degrees_to_graph(start)
-        end_graph_pos = self.degrees_to_graph(end)
+        colors = []
+        for i in range(first_seg, last_seg + 1):
+            speed = sport.get_speed_at_time(track, times[i])
+            # make it grey if it's an outlier
+            if speed is None or speed < speed_range[0]:
+                colors.append('grey')
+            elif speed > speed_range[1]:
+                colors.append((0, 1, 0))
+            else:
+                # scale the speed to be between 0 and 1
+                speed = (speed - speed_range[0]) / (speed_range[1] - speed_range[0])
+                # lerp between red and green
+                colors.append((1 - speed, speed, 0))
 
-        # return the plotted line, its default in a list, but its only ever of
-        # length one so take it out of the list
-        return self.__ax.plot([start_graph_pos[0], end_graph_pos[0]],
-                              [start_graph_pos[1], end_graph_pos[1]],
-                              color=color, linewidth=width)[0]
+        return colors
 
     def draw_point(self, athlete_key: str,
                    pos: tuple[float, float],
@@ -550,16 +564,24 @@ class MapClass:
         :return: None
         """
 
-        # if this athlete has a point already remove it
-        if ('draw_point' in self.__athletes[athlete_key] and
-                self.__athletes[athlete_key]['draw_point'] is not None):
-            self.remove_point(athlete_key)
-
         graph_pos = self.degrees_to_graph(pos)
+        marker = self.__athletes[athlete_key].get('draw_point')
+
+        # if this athlete already has a marker on these axes just move it rather than replotting
+        # (a full redraw clears the axes, so then a new marker is needed)
+        if marker is not None and marker.axes is self.__ax:
+            marker.set_data([graph_pos[0]], [graph_pos[1]])
+            marker.set_markersize(size)
+            marker.set_markeredgecolor(color)
+            marker.set_markerfacecolor(color)
+            return
+
+        # The marker is animated so full redraws skip it and it can be blitted on its own
         self.__athletes[athlete_key]['draw_point'] = self.__ax.plot(graph_pos[0], graph_pos[1],
                                                                     marker="o", markersize=size,
                                                                     markeredgecolor=color,
-                                                                    markerfacecolor=color)[0]
+                                                                    markerfacecolor=color,
+                                                                    animated=True)[0]
 
     def remove_point(self, athlete_key: str) -> None:
         """
@@ -587,12 +609,28 @@ class MapClass:
         if self.tile_bounds_deg is None:
             raise ValueError("Tile bounds not set")
 
-        y_coord = ((degrees[0] - self.tile_bounds_deg[2]) /
-                   (self.tile_bounds_deg[0] - self.tile_bounds_deg[2])) * self.tile_bounds_plt[0]
-        x_coord = ((degrees[1] - self.tile_bounds_deg[3]) /
-                   (self.tile_bounds_deg[1] - self.tile_bounds_deg[3])) * self.tile_bounds_plt[1]
+        return (degrees[1] * self.__x_scale + self.__x_off,
+                degrees[0] * self.__y_scale + self.__y_off)
+
+    def degrees_to_graph_batch(self, latlon: np.ndarray) -> np.ndarray:
+        """
+        Convert many positions to the graph coordinates at once
+
+        :param latlon: (N, 2) array of the degrees to convert (lat,lon)
+        :return: (N, 2) array of the graph coordinates (x,y)
+        """
+        if self.gpx_bounds_deg is None:
+            raise ValueError("GPX bounds not set")
+
+        if self.tile_bounds_deg is None:
+            raise ValueError("Tile bounds not set")
+
+        latlon = np.asarray(latlon, dtype=np.float64).reshape(-1, 2)
+        graph_pos = np.empty_like(latlon)
+        graph_pos[:, 0] = latlon[:, 1] * self.__x_scale + self.__x_off
+        graph_pos[:, 1] = latlon[:, 0] * self.__y_scale + self.__y_off
 
-        return x_coord, y_coord
+        return graph_pos
 
     def __draw_legend(self) -> None:
         """
@@ -610,4 +648,5 @@ class MapClass:
         if self.__ax.get_legend():
             self.__ax.get_legend().remove()
 
+        self.scene_changed = True
         self.__ax.legend(handles=all_patches, fontsize="9", loc='upper right')
@@ -64,9 +64,15 @@ class AppGUI:
         self.__last_stats_update = time.time()
         self.__last_map_update = time.time()
 
-        # Set the map widget in the TOP RIGHT corner
-        self.__map_widget = None
-        self.update_map()
+        # Set the map widget in the TOP RIGHT corner, the canvas is made once and redrawn after
+        self.__canvas = FigureCanvasTkAgg(self.__mpl_graph.get_figure(), master=self.__inner_frame)
+        self.__map_widget = self.__canvas.get_tk_widget()
+        self.__map_widget.grid(row=0, column=1, sticky="nsew", padx=1, pady=1)
+
+        # The map without the athlete markers, grabbed after each full draw so the
+        # markers can be blitted on top of it when nothing else has changed
+        self.__map_background = None
+        self.__canvas.mpl_connect('draw_event', self.__on_map_drawn)
 
         # Create the menus and submenus down the side
         # First initialise the main menus as None
@@ -77,8 +83,11 @@ class AppGUI:
         self.__finishline_menu = None
         self.__playback_menu = None
 
-        # Function for removing focus from widgets once they have been clicked off
-        self.__window.bind_all("<Button-1>", self.__remove_entry_focus)
+        # Function for removing focus from widgets once they have been clicked off.
+        # Only bound to the background widget classes (which have no click bindings of their
+        # own) so clicks on entries, buttons etc. never run it
+        for widget_class in ('Frame', 'TFrame', 'Label', 'TLabel', 'Canvas'):
+            self.__window.bind_class(widget_class, "<Button-1>", self.__remove_focus)
 
         # Create the stats menu
         self.__stats_menu = StatsMenuFrame(self, self.__inner_frame)
@@ -113,11 +122,6 @@ class AppGUI:
         # Set the submenus here after the other variables have been set
         self.__set_submenus()
 
-        # create the map here and its canvas
-        self.__canvas = FigureCanvasTkAgg(self.__mpl_graph.get_figure(), master=self.__inner_frame)
-        self.__map_widget = self.__canvas.get_tk_widget()
-        self.__map_widget.grid(row=0, column=1, sticky="nsew", padx=1, pady=1)
-
         # Is it set up: this gets set to true when init is finished
         self.ready = True
 
@@ -178,15 +182,14 @@ class AppGUI:
         self.__control_menu.update_athlete_data(new_athletes, remake_widgets)
         self.__stats_menu.set_athlete_list(new_athletes)
 
-    def __remove_entry_focus(self, event) -> None:
+    def __remove_focus(self, _event) -> None:
         """
         This function removes focuses from widgets when they are clicked off
 
-        :param event:
-        :return:
+        :param _event: doesn't get used
+        :return: None
         """
-        if not isinstance(event.widget, ttk.Entry):
-            self.__window.focus()
+        self.__window.focus()
 
     def update_map(self, force: bool = False) -> None:
         """
@@ -200,7 +203,37 @@ class AppGUI:
             return
         self.__last_map_update = time.time()
 
-        self.__canvas.draw()
+        if self.__mpl_graph.scene_changed or self.__map_background is None:
+            # schedule a full redraw of the existing canvas for when tk is next idle
+            self.__mpl_graph.scene_changed = False
+            self.__canvas.draw_idle()
+        else:
+            # only the markers have moved so draw them over the saved background
+            axes = self.__mpl_graph.get_axes()
+            self.__canvas.restore_region(self.__map_background)
+            self.__draw_map_markers()
+            self.__canvas.blit(axes.bbox)
+
+    def __on_map_drawn(self, _event) -> None:
+        """
+        Called after every full draw of the map, saves the background and then
+        draws the animated athlete markers on top
+
+        :param _event: doesn't get used
+        :return: None
+        """
+        self.__map_background = self.__canvas.copy_from_bbox(self.__mpl_graph.get_axes().bbox)
+        self.__draw_map_markers()
+
+    def __draw_map_markers(self) -> None:
+        """
+        Draws the animated athlete markers onto the map canvas
+
+        :return: None
+        """
+        axes = self.__mpl_graph.get_axes()
+        for marker in self.__mpl_graph.get_point_artists():
+            axes.draw_artist(marker)
 
     def __set_submenus(self) -> None:
         """
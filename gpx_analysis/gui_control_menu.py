@@ -351,18 +351,12 @@ class ControlMenuFrame:
         if athlete_key:
             self.__delete_callback(athlete_key)
 
-    def __on_athlete_swap(self, *args) -> None:
+    def __on_athlete_swap(self, *_args) -> None:
         """
         Gets called when you change which athlete is selected in the dropdown
 
         :return:
         """
-        # *args must be here as we get 4 params, yet we do nothing with them so pylint unhappy
-        # Thus do something random with them
-        for arg in args:
-            if arg == 1:
-                pass
-
         self.__last_selected = self.__value_map_dropdown.get()
 
         # update the info labels
@@ -238,17 +238,14 @@ class FinishlineMenuFrame:
                                                           round(float(value), 1), None)
                 self.__update_start_finish_times_text()
 
-    def __on_start_slider_changed(self, event) -> None:
+    def __on_start_slider_changed(self, _event) -> None:
         """
         This gets called when the start slider changed
 
-        :param event: doesn't get used
+        :param _event: doesn't get used
         :return: None
         """
 
-        if event == 1:  # test to keep pylint happy
-            pass
-
         # Not allowed to change when not editing, ignore it
         if self.__checkbox_value.get() is False:
             return
@@ -278,19 +275,16 @@ class FinishlineMenuFrame:
                                                       None, round(float(value), 1))
             self.__update_start_finish_times_text()
 
-    def __on_end_slider_changed(self, event) -> None:
+    def __on_end_slider_changed(self, _event) -> None:
         """
         This gets called when the end slider changed
 
-        :param event: doesn't get used
+        :param _event: doesn't get used
         :return: None
         """
         if self.__checkbox_value.get() is False:
             return
 
-        if event == 1:  # test to keep pylint happy
-            pass
-
         value = round(self.__slider_finishline_menu_end.get() * self.__total_time / 100.0, 1)
         # print(f'end slider changed to {value}')
 
@@ -9,6 +9,10 @@ The AppGUI class is the only one to use outside of this class
 import tkinter as tk
 from tkinter import ttk
 
+# The icons for the playback button
+_PAUSE = '\u23F8'  # shown while playing
+_PLAY = '\u23F5'  # shown while paused
+
 
 class PlaybackMenuFrame:
     """
@@ -32,6 +36,18 @@ class PlaybackMenuFrame:
 
         self.__max_time = 100  # The upper end of the slider and max time for the athletes
 
+        # Handles for slider updates waiting to run, so a drag only updates once per frame
+        self.__slider_update_delay = 16  # ms between slider updates (roughly 60fps)
+        self.__pending_time_update = None
+        self.__pending_speed_update = None
+        self.__pending_zoom_update = None
+
+        # The last slider values used, rounded to how precise they need to be so slider
+        # events that wouldn't make a visible difference get ignored
+        self.__last_time_value = None  # to 0.1s
+        self.__last_speed_value = None  # to 0.1x
+        self.__last_zoom_value = None  # to 0.01
+
         # Add a title
         label_playback_menu = ttk.Label(master=self.__frm_map_playback_menu,
                                         text="Simulation Menu",
@@ -43,12 +59,21 @@ class PlaybackMenuFrame:
                                                 from_=0, to=1, length=250,
                                                 command=self.__on_time_slider_changed)
         self.__slider_playback_time.grid(row=2, column=0)
-        # create the playback time label
-        self.__label_playback_time = None
+        # create the playback time label, made once and its text modified after
+        self.__label_playback_time = ttk.Label(master=self.__frm_map_playback_menu,
+                                               text="Playback Time: 0.0s")
+        self.__label_playback_time.grid(row=1, column=0, sticky='n')
         self.set_playback_time(0, 100)
 
+        # The speed slider goes from 0.1x to 10x and gets rounded to 1dp, so precompute
+        # the label text for every position it can show
+        self.__speed_label_cache = {round(i * 0.1, 1): f"Playback speed: {i * 0.1:.1f}x"
+                                    for i in range(1, 101)}
+
         # Create playback speed label
-        self.__label_playback_speed = None
+        self.__label_playback_speed = ttk.Label(master=self.__frm_map_playback_menu,
+                                                text="Playback speed: 1.0x")
+        self.__label_playback_speed.grid(row=3, column=0, sticky='n')
         self.set_playback_speed(1)
 
         # Create speed slider
@@ -93,27 +118,28 @@ class PlaybackMenuFrame:
 
     def __create_playback_button(self) -> None:
         """
-        create the playback button widget with its current state
+        create the playback button widget and its style, this is only done once
 
         :return: None
         """
 
-        char = '\u23F8'  # paused
-        if not self.__button_playing:
-            char = '\u23F5'
-
         self.__style_playback_button = ttk.Style()
         self.__style_playback_button.configure('playback.TButton', font=('Helvetica', 40))
 
-        # If we have made it before destroy the old copy
-        if isinstance(self.__but_playback_menu, ttk.Button):
-            self.__but_playback_menu.destroy()
-
-        self.__but_playback_menu = ttk.Button(master=self.__frm_map_playback_menu, text=char,
+        self.__but_playback_menu = ttk.Button(master=self.__frm_map_playback_menu,
+                                              text=self.__get_playback_char(),
                                               style='playback.TButton', width=1,
                                               command=self.__on_button_pressed)
         self.__but_playback_menu.grid(row=6, column=0)
 
+    def __get_playback_char(self) -> str:
+        """
+        Get the icon the playback button should show for its current state
+
+        :return: the icon character
+        """
+        return _PAUSE if self.__button_playing else _PLAY
+
     def set_playback_time(self, playback_time: float, total_time: float) -> None:
         """
         Set the playback time of the simulation and display it on the text
@@ -123,9 +149,7 @@ class PlaybackMenuFrame:
         :return: None
         """
         self.__max_time = total_time
-
-        # round the data to make it nice
-        playback_time = round(playback_time, 1)
+        self.__last_time_value = round(playback_time, 1)
 
         # set it on the label
         self.__set_playback_time_label(playback_time)
@@ -136,18 +160,13 @@ class PlaybackMenuFrame:
 
     def __set_playback_time_label(self, playback_time: float) -> None:
         """
-        sets the playback time on the gui label
+        sets the playback time on the gui label, rounded to 1dp
 
         :param playback_time: the playback time to set
         :return: None
         """
 
-        if isinstance(self.__label_playback_time, ttk.Label):
-            self.__label_playback_time.destroy()
-
-        self.__label_playback_time = ttk.Label(master=self.__frm_map_playback_menu,
-                                               text=f"Playback Time: {playback_time}s")
-        self.__label_playback_time.grid(row=1, column=0, sticky='n')
+        self.__label_playback_time.configure(text=f"Playback Time: {playback_time:.1f}s")
 
     def set_playback_speed(self, playback_speed: float) -> None:
         """
@@ -159,14 +178,13 @@ class PlaybackMenuFrame:
 
         # round the data to make it nice
         playback_speed = round(playback_speed, 1)
+        self.__last_speed_value = playback_speed
 
-        # If we have made it before destroy the old copy
-        if isinstance(self.__label_playback_speed, ttk.Label):
-            self.__label_playback_speed.destroy()
-
-        self.__label_playback_speed = ttk.Label(master=self.__frm_map_playback_menu,
-                                                text=f"Playback speed: {playback_speed}x")
-        self.__label_playback_speed.grid(row=3, column=0, sticky='n')
+        # use the precomputed text if we can
+        speed_text = self.__speed_label_cache.get(playback_speed)
+        if speed_text is None:
+            speed_text = f"Playback speed: {playback_speed:.1f}x"
+        self.__label_playback_speed.configure(text=speed_text)
 
         if self.__parent_class.set_playback_speed:  # check it's been defined
             self.__parent_class.set_playback_speed(playback_speed)
@@ -184,55 +202,106 @@ class PlaybackMenuFrame:
         self.__parent_class.set_playing(self.__button_playing)
         self.__parent_class.stop_finish_start_editing()  # close the finishline menu
 
-        self.__create_playback_button()  # remake the button with new icon
+        # swap the icon on the button
+        self.__but_playback_menu.configure(text=self.__get_playback_char())
 
-    def __on_time_slider_changed(self, event) -> None:
+    def __on_time_slider_changed(self, _event) -> None:
         """
-        This gets called when the time slider changed and its not playing
+        This gets called when the time slider changed, it schedules an update
+        so a whole burst of slider events only updates once
 
-        :param event: doesn't get used
+        :param _event: doesn't get used
         :return: None
         """
 
-        if event == 1:  # test to keep pylint happy
-            pass
+        # ignore it if the time hasn't changed enough to show
+        value = self.__slider_playback_time.get()
+        if round(value * self.__max_time, 1) == self.__last_time_value:
+            return
+
+        if self.__pending_time_update is not None:  # an update is already on its way
+            return
+
+        self.__pending_time_update = self.__parent_class.get_tk_window().after(
+            self.__slider_update_delay, self.__flush_time_update)
+
+    def __flush_time_update(self) -> None:
+        """
+        Applies the latest time slider value if its not playing
+
+        :return: None
+        """
+        self.__pending_time_update = None
 
         value = self.__slider_playback_time.get()
 
         # check its been defined and not playing now
         if self.__parent_class.set_playback_time and not self.__parent_class.get_playing():
+            self.__last_time_value = round(value * self.__max_time, 1)
             # update the app class's time
             self.__parent_class.set_playback_time(value * self.__max_time)
             # update the label in GUI too
-            self.__set_playback_time_label(round(value * self.__max_time, 1))
+            self.__set_playback_time_label(value * self.__max_time)
 
-    def __on_speed_slider_changed(self, event) -> None:
+    def __on_speed_slider_changed(self, _event) -> None:
         """
-        This gets called when the speed slider changed
+        This gets called when the speed slider changed, it schedules an update
+        so a whole burst of slider events only updates once
 
-        :param event: doesn't get used
+        :param _event: doesn't get used
         :return: None
         """
 
-        if event == 1:  # test to keep pylint happy
-            pass
+        # ignore it if the speed hasn't changed enough to show
+        if round(self.__slider_playback_speed.get(), 1) == self.__last_speed_value:
+            return
+
+        if self.__pending_speed_update is not None:  # an update is already on its way
+            return
+
+        self.__pending_speed_update = self.__parent_class.get_tk_window().after(
+            self.__slider_update_delay, self.__flush_speed_update)
+
+    def __flush_speed_update(self) -> None:
+        """
+        Applies the latest speed slider value
+
+        :return: None
+        """
+        self.__pending_speed_update = None
 
         value = self.__slider_playback_speed.get()
         # # convert with exponents so instead of -2 to 2 its 0.25x to 4x
         # value = 2.0 ** value
         self.set_playback_speed(value)
 
-    def __on_zoom_slider_changed(self, *args) -> None:
+    def __on_zoom_slider_changed(self, *_args) -> None:
         """
-        This gets called when the zoom slider changes
+        This gets called when the zoom slider changes, it schedules an update
+        so a whole burst of slider events only updates once
 
         :return: None
         """
 
-        # *args is never used in this function but pylint will be upset it's not used
-        # Do some random stuff to it
-        if args == 1:
-            pass
+        # ignore it if the zoom hasn't changed enough to show
+        if round(self.__slider_playback_zoom.get(), 2) == self.__last_zoom_value:
+            return
+
+        if self.__pending_zoom_update is not None:  # an update is already on its way
+            return
+
+        self.__pending_zoom_update = self.__parent_class.get_tk_window().after(
+            self.__slider_update_delay, self.__flush_zoom_update)
+
+    def __flush_zoom_update(self) -> None:
+        """
+        Applies the latest zoom slider value
+
+        :return: None
+        """
+        self.__pending_zoom_update = None
 
-        value = 1.0 - self.__slider_playback_zoom.get()
+        value = self.__slider_playback_zoom.get()
+        self.__last_zoom_value = round(value, 2)
+        value = 1.0 - value
         self.__parent_class.set_zoom_level(value)
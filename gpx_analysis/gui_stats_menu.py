@@ -9,7 +9,9 @@ The AppGUI class is the only one to use outside of this class
 # Import external libs
 import tkinter as tk
 from tkinter import ttk
+from tkinter import font as tkfont
 import time
+import itertools
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg  # for importing figs to mpl
 
 # import our own library
@@ -65,19 +67,26 @@ class StatsMenuFrame:
         self.__value_graph_selected_option = None
         self.__create_graph_type_dropdown()
 
-        # Create the checklist
-        self.__menu_choices = None
-        self.__menubutton = None
-        self.__menu = None
-        self.__create_athlete_selection_menu()  # make it empty at the start
+        # Create the athlete selection list
+        self.__frm_athlete_selection = None
+        self.__lst_athletes = None
+        self.__athlete_options = []  # (filename, display name) in the order they are listed
+        self.__selected_athletes = set()  # filenames of the selected athletes
+        self.__create_athlete_selection_menu()
+        self.__set_athlete_options()  # make it empty at the start
 
         # Space in the grid
         self.__frm_stats_menu.rowconfigure(5, minsize=20)
 
-        # Big label below to show all the stats
-        test_data = {}
-        self.__label_stats_text = None
-        self.__display_text(test_data)
+        # Big label below to show all the stats, made once and its text modified after.
+        # Its monospace font is made once too so tk doesn't look it up by name again
+        self.__stats_font = tkfont.Font(root=self.__parent_class.get_tk_window(), family='Courier')
+        self.__label_stats_text = ttk.Label(master=self.__frm_stats_menu, text='',
+                                            font=self.__stats_font, justify='left')
+        self.__label_stats_text.grid(row=6, column=0, sticky='w')
+        self.__last_data_sig = None  # the data last displayed so we can skip repeat updates
+        self.__disp_tokens = itertools.count()  # tokens so stale text updates can be dropped
+        self.__latest_disp_token = None
 
         # Create the graph frame
         self.__frm_stats_graph = None
@@ -162,13 +171,8 @@ class StatsMenuFrame:
         stats_data = {}
         for athlete in self.__athlete_data.values():
 
-            # ignore this athlete if they're not in the selector options
-            if athlete['filename'] not in self.__menu_choices:
-                continue
-
             # ignore this athlete if they aren't selected
-            if (isinstance(self.__menu_choices[athlete['filename']], tk.IntVar)
-                    and self.__menu_choices[athlete['filename']].get() == 0):
+            if athlete['filename'] not in self.__selected_athletes:
                 continue
 
             # Fetch all the data needed for this entry
@@ -194,8 +198,8 @@ class StatsMenuFrame:
             units = self.__value_speed_selected_option.get()
             speed = sport.convert_speed_units(speed, units)
             if units in ['s/500m', 's/km']:  # for units measured in mins and secs write diff format
-                mins = int(speed / 60)
-                secs = round(speed % 60, 1)
+                mins, secs = divmod(speed, 60)
+                mins, secs = int(mins), round(secs, 1)
                 if secs < 10:  # so seconds starts with a preceeding 0
                     secs = f'0{secs}'
                 speed = f'{mins}:{secs} {units}'
@@ -218,15 +222,15 @@ class StatsMenuFrame:
         """
         self.__athlete_data = athletes
 
-        # remake athlete list
-        self.__create_athlete_selection_menu()
-
-        # Set the athlete list on the graph
-        self.__stats_graph.set_athletes(athletes)
-        option = (f'{self.__value_graph_selected_option.get()}|'
-                  f'{self.__value_speed_selected_option.get()}')
-        self.__stats_graph.draw_base_graph(option)
-        self.__update_graph()
+        # only refill the athlete list if the athletes (or their names) in it have changed,
+        # otherwise keep it and the user's selection as they are
+        athlete_options = [(athlete['filename'], athlete['display_name'])
+                           for athlete in athletes.values()]
+        if athlete_options != self.__athlete_options:
+            self.__set_athlete_options()
+        else:
+            # the athlete data may still have changed so update the stats and graph
+            self.__on_athlete_change()
 
     def __display_text(self, data_in: dict) -> None:
         """
@@ -236,81 +240,83 @@ class StatsMenuFrame:
         :return: None
         """
 
-        # if nothing in the dictionary then set the text blank
-        disp_text = ''
-        if data_in:
-            # Sort the athletes by highest dist, dodgy insertion sort
-            modified_data = []
-            while len(data_in):
-                max_dist = -1  # no distance will not be greater than this
-                max_key = None
-                for key, value in data_in.items():
-                    test_val = value['dist']
-                    if test_val > max_dist:
-                        max_dist = test_val
-                        max_key = key
-
-                # Make sure athlete distance renders correctly
-                if max_dist > 100000:
-                    # if its over 100,000m (unrealistic number) say its finished
-                    new_dist = 'FIN'
-                else:
-                    new_dist = f'{max_dist}m'
-                modified_data.append({'name': max_key, 'dist': new_dist,
-                                      'spd': data_in[max_key]['spd'],
-                                      'cad': data_in[max_key]['cad']})
-                del data_in[max_key]
-
-            disp_text = ''
-
-            max_athlete_dist_len = max(len(i['dist']) for i in modified_data) + 2
-
-            for position, athlete_data in enumerate(modified_data):
-                # make it so all the data starts lining up after names
-                athlete_name = athlete_data['name']
-                athlete_dist = athlete_data['dist']
-                athlete_spd = athlete_data['spd']
-                athlete_cad = athlete_data['cad']
-
-                disp_text += (f'{position + 1}. ' + athlete_name + '\n' + '   ' +
-                              athlete_dist + ' ' * (max_athlete_dist_len - len(
-                            athlete_dist)) + athlete_spd + '   ' + f'{athlete_cad} s/m')
-
-                disp_text += '\n'  # so it starts on a new line
-
-        # If its been made before just modify text
-        if isinstance(self.__label_stats_text, ttk.Label):
-            self.__label_stats_text.configure(text=disp_text)
+        # if the data hasn't changed since it was last displayed there's nothing to do
+        data_sig = tuple((key, value['dist'], value['spd'], value['cad'])
+                         for key, value in data_in.items())
+        if data_sig == self.__last_data_sig:
+            return
+        self.__last_data_sig = data_sig
 
-        else:
-            self.__label_stats_text = ttk.Label(master=self.__frm_stats_menu, text=disp_text,
-                                                font='Courier')
-            self.__label_stats_text.grid(row=6, column=0, sticky='w')
+        # Format the text when tk is next idle so bursts of updates don't hold up the
+        # event loop, the token means only the newest of any queued updates gets shown
+        self.__latest_disp_token = next(self.__disp_tokens)
+        self.__parent_class.get_tk_window().after_idle(self.__apply_disp_text,
+                                                       self.__latest_disp_token, data_in)
+
+    def __apply_disp_text(self, token: int, data_in: dict) -> None:
+        """
+        Formats the stats text and sets it on the label, unless a newer update has been queued
+
+        :param token: The token given to this update when it was queued
+        :param data_in: A dictionary where boat display name is key and data is the value
+        :return: None
+        """
+        if token != self.__latest_disp_token:  # this data is already out of date
+            return
+
+        self.__label_stats_text.configure(text=format_stats_text(data_in))
 
     def __create_athlete_selection_menu(self) -> None:
         """
-        Creates the athlete selection menu from the athlete variable
+        Creates the athlete selection list widget, it gets filled by __set_athlete_options
 
         :return: None
         """
-        self.__menubutton = tk.Menubutton(self.__frm_stats_menu,
-                                          text="Choose Which athletes to show:",
-                                          indicatoron=True)
-        self.__menu = tk.Menu(self.__menubutton, tearoff=False)
-        self.__menubutton.configure(menu=self.__menu)
-        self.__menubutton.grid(row=4, column=0, sticky='w')
-        self.__menu_choices = {}
-        root = self.__parent_class.get_tk_window()
+        # Encapsulate the list and its label in a frame
+        self.__frm_athlete_selection = ttk.Frame(self.__frm_stats_menu,
+                                                 relief=tk.FLAT, borderwidth=0)
+        self.__frm_athlete_selection.grid(row=4, column=0, sticky='nsew')
+        self.__frm_athlete_selection.grid_columnconfigure(0, weight=1)
 
-        for athlete in self.__athlete_data.values():
-            display_name = athlete['display_name']
-            filename = athlete['filename']
+        # This doesn't need to be an instance var since we won't modify it again
+        label_athlete_selection = ttk.Label(master=self.__frm_athlete_selection,
+                                            text="Choose Which athletes to show:")
+        label_athlete_selection.grid(row=0, column=0, sticky='w')
+
+        # One listbox holds every athlete, selected ones are shown
+        self.__lst_athletes = tk.Listbox(self.__frm_athlete_selection,
+                                         selectmode=tk.MULTIPLE, exportselection=False,
+                                         activestyle='none', height=1)
+        self.__lst_athletes.grid(row=1, column=0, sticky='ew')
+        self.__lst_athletes.bind('<<ListboxSelect>>', self.__on_athlete_change)
+
+    def __set_athlete_options(self) -> None:
+        """
+        Refills the athlete selection list from the athlete variable, all athletes start selected.
+        This also updates the stats and graph with the new athletes
+
+        :return: None
+        """
+        self.__athlete_options = [(athlete['filename'], athlete['display_name'])
+                                  for athlete in self.__athlete_data.values()]
+        display_names = [option[1] for option in self.__athlete_options]
+
+        self.__lst_athletes.delete(0, tk.END)
+        if display_names:
+            self.__lst_athletes.insert(tk.END, *display_names)
+        self.__lst_athletes.configure(height=max(1, len(display_names)))
+        self.__lst_athletes.selection_set(0, tk.END)
 
-            self.__menu_choices[filename] = tk.IntVar(master=root, value=1)
-            self.__menu.add_checkbutton(label=display_name, variable=self.__menu_choices[filename],
-                                        onvalue=1, offvalue=0, command=self.__on_athlete_change)
         self.__on_athlete_change()
 
+    def __get_selected_athletes(self) -> set[str]:
+        """
+        Get the athletes currently selected in the athlete selection list
+
+        :return: a set of the filenames of the selected athletes
+        """
+        return {self.__athlete_options[i][0] for i in self.__lst_athletes.curselection()}
+
     def __create_units_menu(self) -> None:
         """
         Create the frame with a units dropdown and button to confirm
@@ -340,30 +346,24 @@ class StatsMenuFrame:
                                              text="Choose Speed Units:     ")
         label_stats_speed_choice.grid(row=0, column=0)
 
-    def __on_athlete_change(self, *args) -> None:
+    def __on_athlete_change(self, *_args) -> None:
         """
         This gets called when an athlete gets selected or deselected
-        in the dropdown checklist
+        in the athlete selection list
 
-        :param args: *args
+        :param _args: *args
         :return: None
         """
 
-        # *args is never used in this function but pylint will be upset it's not used
-        # Do some random stuff to it
-        if args == 1:
-            pass
+        # read the selection from the list once, everything else uses this set
+        self.__selected_athletes = self.__get_selected_athletes()
 
         # update the stats with the new selection
         self.update_stats()
 
         # only include the athletes selected on the graph
-        graph_athletes = {}
-        for key, value in self.__athlete_data.items():
-            if (isinstance(self.__menu_choices[value['filename']], tk.IntVar)
-                    and self.__menu_choices[value['filename']].get() == 0):
-                continue
-            graph_athletes[key] = value
+        graph_athletes = {key: value for key, value in self.__athlete_data.items()
+                          if value['filename'] in self.__selected_athletes}
 
         if self.__parent_class.ready:
             self.__stats_graph.set_athletes(graph_athletes)
@@ -372,18 +372,13 @@ class StatsMenuFrame:
             self.__stats_graph.draw_base_graph(option)
             self.__update_graph()
 
-    def __on_speed_option_change(self, *args) -> None:
+    def __on_speed_option_change(self, *_args) -> None:
         """
         Called when speed option changes
 
         :return: None
         """
 
-        # *args is never used in this function but pylint will be upset it's not used
-        # Do some random stuff to it
-        if args == 1:
-            pass
-
         # update the stats with the new units
         self.update_stats()
 
@@ -393,20 +388,53 @@ class StatsMenuFrame:
         self.__stats_graph.draw_base_graph(option)
         self.__update_graph()
 
-    def __on_graph_option_change(self, *args) -> None:
+    def __on_graph_option_change(self, *_args) -> None:
         """
         Called when graph option changes
 
         :return: None
         """
 
-        # *args is never used in this function but pylint will be upset it's not used
-        # Do some random stuff to it
-        if args == 1:
-            pass
-
         # update the stats graph
         option = (f'{self.__value_graph_selected_option.get()}|'
                   f'{self.__value_speed_selected_option.get()}')
         self.__stats_graph.draw_base_graph(option)
         self.__update_graph()
+
+
+def format_stats_text(data_in: dict) -> str:
+    """
+    Formats the stats data into the text shown in the stats menu, ranked by distance.
+    This doesn't touch tk so it is safe to call from anywhere
+
+    :param data_in: A dictionary where boat display name is key and data is the value
+    :return: The text to display
+    """
+
+    # if nothing in the dictionary then set the text blank
+    disp_text = ''
+    if data_in:
+        # Sort the athletes by highest dist, without modifying the dict passed in
+        sorted_items = sorted(data_in.items(), key=lambda item: item[1]['dist'],
+                              reverse=True)
+
+        # Make sure athlete distance renders correctly,
+        # if its over 100,000m (unrealistic number) say its finished
+        modified_data = [{'name': key,
+                          'dist': 'FIN' if value['dist'] > 100000 else f"{value['dist']}m",
+                          'spd': value['spd'],
+                          'cad': value['cad']}
+                         for key, value in sorted_items]
+
+        # make it so all the data starts lining up after names
+        max_athlete_dist_len = max(len(i['dist']) for i in modified_data) + 2
+
+        lines = [f"{position + 1}. {athlete['name']}\n"
+                 f"   {athlete['dist'].ljust(max_athlete_dist_len)}{athlete['spd']}"
+                 f"   {athlete['cad']} s/m"
+                 for position, athlete in enumerate(modified_data)]
+
+        # each athlete starts on a new line
+        disp_text = '\n'.join(lines) + '\n'
+
+    return disp_text
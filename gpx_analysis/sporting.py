@@ -2,6 +2,7 @@
 This module contains the functions needed for the sporting analysis
 eg. getting position,velocity etc. at a given time
 """
+import numpy as np
 
 try:
     from gpx_analysis import gpx_parser as gpx
@@ -36,18 +37,14 @@ def get_surrounding_points_at_time(track: gpx.Track, time: float) \
     """
 
     track_points = track.get_track_points()
+    times = track.get_relative_times()
 
-    # Iterate through all points to find the two points either side of the position
-    # Also get the time the boat was at these two points
-
-    point_id_above, point_id_below = None, None
-    for point_id, point in enumerate(track_points):
-        if point.get_relative_time() > time:
-            point_id_above = point_id
-            point_id_below = point_id - 1
-            return track_points[point_id_below], track_points[point_id_above]
+    # The times only go up so binary search for the first point after this time
+    point_id_above = int(np.searchsorted(times, time, side='right'))
+    if point_id_above == 0 or point_id_above == len(times):
+        return None, None
 
-    return None, None
+    return track_points[point_id_above - 1], track_points[point_id_above]
 
 
 def get_position_at_time(track: gpx.Track, time: float) -> tuple[float, float]:
@@ -66,7 +63,12 @@ def get_position_at_time(track: gpx.Track, time: float) -> tuple[float, float]:
         # WARNING this time is after the end time it is technically invalid
         return last_point.get_position_degrees()
 
-    # Iterate through all points to find the two points either side of the position
+    first_point = track_points[0]
+    if time <= first_point.get_relative_time():
+        # Before the start so just sit on the first point
+        return first_point.get_position_degrees()
+
+    # Find the two points either side of the position
     # Also get the time the boat was at these two points
 
     point_below, point_above = get_surrounding_points_at_time(track, time)
@@ -102,11 +104,6 @@ def get_speed_at_time(track: gpx.Track, time: float) -> float:
     point_below, point_above = get_surrounding_points_at_time(track, time)
 
     # try to widen the range of points
-    if point_below is not None:
-        below_ind = track_points.index(point_below)
-    if point_above is not None:
-        above_ind = track_points.index(point_above)
-
     expansion_time_width = 20
     point_time_below = get_surrounding_points_at_time(track, time - (expansion_time_width / 2))[0]
     point_time_above = get_surrounding_points_at_time(track, time + (expansion_time_width / 2))[1]
@@ -200,6 +197,28 @@ def get_elevation_at_time(track: gpx.Track, time: float) -> float:
     return elevation
 
 
+def get_cumulative_distances(track: gpx.Track) -> np.ndarray:
+    """
+    Returns the distance travelled up to each point on a track, it's only
+    calculated once then cached on the track
+
+    :param track: The track to get the cumulative distances of
+    :return: Array of the cumulative distance at each track point (in meters)
+    """
+    cumulative_distances = track.get_cumulative_distances()
+    if cumulative_distances is None:
+        positions = np.asarray([point.get_position_degrees()
+                                for point in track.get_track_points()],
+                               dtype=np.float64).reshape(-1, 2)
+        segment_distances = np.abs(geo.geo_distance_vec(positions[:-1, 0], positions[:-1, 1],
+                                                        positions[1:, 0], positions[1:, 1]))
+
+        cumulative_distances = np.concatenate(([0.0], np.cumsum(segment_distances)))
+        track.set_cumulative_distances(cumulative_distances)
+
+    return cumulative_distances
+
+
 def get_cumulative_dist_at_time(track: gpx.Track, time: float) -> float:
     """
     Returns the cumulative distance on a gpx track at a given time
@@ -208,38 +227,24 @@ def get_cumulative_dist_at_time(track: gpx.Track, time: float) -> float:
     :param time: The time to get the cumulative distance at
     :return: The cumulative distance at the given time (in meters)
     """
-    track_points = track.get_track_points()
-
-    total_dist = 0
-    # Iterate through all points until I get to one greater than my time
+    times = track.get_relative_times()
+    if len(times) < 2:
+        return 0
 
-    for point_id, point in enumerate(track_points[1:]):  # Ignore the first item as we use it
-        # Is this the set of points I'm currently between at this time
-        point_id = point_id + 1  # So enumerate id starts at 1
+    cumulative_distances = get_cumulative_distances(track)
 
-        if point.get_relative_time() > time:
-            # Yes get the distance I am from the point before and add it on then return
-            point_below = track_points[point_id - 1]
-            time_below = point_below.get_relative_time()
-            time_above = point.get_relative_time()
-            dist_between = abs(geo.geo_distance(point.get_position_degrees()[0],
-                                                point.get_position_degrees()[1],
-                                                point_below.get_position_degrees()[0],
-                                                point_below.get_position_degrees()[1]))
-            # print(dist_between)
+    # Find the first point after this time
+    point_id = int(np.searchsorted(times, time, side='right'))
+    if point_id == len(times):  # we're past the end so it's the whole distance
+        return round(float(cumulative_distances[-1]), 2)
 
-            total_dist += map_ranges(time, time_below, time_above, 0, dist_between)
-            break
+    # Get the distance I am from the point before and add it on
+    point_id = max(point_id, 1)
+    time_below, time_above = float(times[point_id - 1]), float(times[point_id])
+    dist_below = float(cumulative_distances[point_id - 1])
+    dist_between = float(cumulative_distances[point_id]) - dist_below
 
-        # No need for an else since it broke in the last if
-        # No Add the distance between this point and the last point to the total distance
-        point_below = track_points[point_id - 1]
-        total_dist += abs(geo.geo_distance(point.get_position_degrees()[0],
-                                           point.get_position_degrees()[1],
-                                           point_below.get_position_degrees()[0],
-                                           point_below.get_position_degrees()[1]))
-
-    return round(total_dist, 2)
+    return round(dist_below + map_ranges(time, time_below, time_above, 0, dist_between), 2)
 
 
 def get_total_distance(track: gpx.Track) -> float:
@@ -250,7 +255,18 @@ def get_total_distance(track: gpx.Track) -> float:
     :return: The total distance of the track
     """
 
-    return get_cumulative_dist_at_time(track, track.get_track_points()[-1].get_relative_time())
+    # the whole distance is just the last cumulative distance
+    return round(float(get_cumulative_distances(track)[-1]), 2)
+
+
+# How to get from m/s to each of the speed units
+_SPEED_CONVERSIONS = {
+    "m/s": lambda speed: round(speed, 1),
+    "km/h": lambda speed: round(speed * 3.6, 1),
+    "mph": lambda speed: round(speed * 2.237, 1),
+    "s/500m": lambda speed: round(500 / speed, 1),
+    "s/km": lambda speed: round(1000 / speed, 1),
+}
 
 
 def convert_speed_units(speed: float, unit: str) -> float:
@@ -262,24 +278,11 @@ def convert_speed_units(speed: float, unit: str) -> float:
     :return: The speed in the new unit
     """
 
-    if not isinstance(speed, float):
-        raise TypeError("Speed must be a float")
-    if not isinstance(unit, str):
-        raise TypeError("Unit must be a string")
-
     speed = speed if speed != 0 else 0.1
 
-    if unit == "m/s":
-        return round(speed, 1)
-    if unit == "km/h":
-        return round(speed * 3.6, 1)
-    if unit == "mph":
-        return round(speed * 2.237, 1)
-    if unit == "s/500m":
-        total = round(500 / speed, 1)
-        return total
-    if unit == "s/km":
-        total = round(1000 / speed, 1)
-        return total
-
-    raise ValueError("Unit must be one of: m/s, km/h, mph, s/500m or s/km")
+    try:
+        conversion = _SPEED_CONVERSIONS[unit]
+    except KeyError as exc:
+        raise ValueError("Unit must be one of: m/s, km/h, mph, s/500m or s/km") from exc
+
+    return conversion(speed)
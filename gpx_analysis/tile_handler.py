@@ -0,0 +1,468 @@
+"""
+This module handles fetching the OSM tiles for the map, both downloading them
+and caching them on disk
+"""
+
+import math
+import io
+import asyncio
+import functools
+import threading
+import sqlite3
+import atexit
+import os.path
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import PIL.Image
+import numpy as np
+import urllib3
+from appdirs import user_data_dir
+
+try:
+    from gpx_analysis import gpx_parser as gpx
+except ImportError:
+    import gpx_parser as gpx
+
+# How many tiles to request at once, lower this if the tile server starts throttling
+MAX_DOWNLOAD_WORKERS = 8
+
+# The threads tiles get loaded/downloaded on, separate from asyncio's default executor so
+# the limit above holds no matter what else is running in the background
+_DOWNLOAD_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS,
+                                        thread_name_prefix='tile-download')
+
+# One connection pool shared by every tile download so connections to the tile server get
+# reused instead of doing a new TCP + TLS handshake per tile. It's at least as big as the
+# download pool so no thread has to wait for a connection
+_POOL = urllib3.PoolManager(num_pools=1, maxsize=MAX_DOWNLOAD_WORKERS,
+                            retries=urllib3.Retry(3, backoff_factor=0.2))
+
+_TILE_HOST = 'server.arcgisonline.com'
+# the tile url, formatted with (zoom, y, x)
+_URL_TMPL = (f'https://{_TILE_HOST}/ArcGIS/rest/services/'
+             'World_Topo_Map/MapServer/tile/{}/{}/{}')
+
+
+def _warm_up_connection() -> None:
+    """
+    Request one tile's headers so a connection to the tile server (DNS, TCP and TLS all
+    done) is left open in the pool for the first real download to reuse
+
+    :return: None
+    """
+    try:
+        _POOL.request('HEAD', _URL_TMPL.format(0, 0, 0), timeout=5.0, retries=False)
+    except (urllib3.exceptions.HTTPError, OSError):  # offline, the downloads will report it
+        pass
+
+
+def warm_up_tile_server() -> None:
+    """
+    Start connecting to the tile server in the background, so the first tiles come in
+    sooner. Only one connection gets opened, and if the server closes it before
+    the tiles are requested they just connect as normal
+
+    :return: None
+    """
+    threading.Thread(target=_warm_up_connection, daemon=True).start()
+
+
+@functools.lru_cache(maxsize=1024)
+def deg2num(lat_deg: float, lon_deg: float, zoom: int) -> tuple[int, int]:
+    """
+    Code for converting lat lon to tile number from
+    https://wiki.openstreetmap.org/wiki/Slippy_map_tilenames
+
+    :param lat_deg: Input latitude
+    :param lon_deg: Input longitude
+    :param zoom: OSM zoom level
+    :return: the OSM tile position
+    """
+    lat_rad = math.radians(lat_deg)
+    exp_zoom = 2.0 ** zoom
+    xtile = int((lon_deg + 180.0) / 360.0 * exp_zoom)
+    ytile = int((1.0 - math.log(math.tan(lat_rad) +
+                                (1 / math.cos(lat_rad))) / math.pi) / 2.0 * exp_zoom)
+    return xtile, ytile
+
+
+@functools.lru_cache(maxsize=1024)
+def num2deg(xtile: int, ytile: int, zoom: int) -> tuple[float, float]:
+    """
+    Code for converting tile number to lat lon from
+    https://wiki.openstreetmap.org/wiki/Slippy_map_tilenames
+
+    :param xtile: The tile x coordinate
+    :param ytile: The tile y corrdinate
+    :param zoom: The osm zoom level
+    :return: (latitude, longitude)
+    """
+    exp_zoom = 2.0 ** zoom
+    lon_deg = xtile / exp_zoom * 360.0 - 180.0
+    lat_rad = math.atan(math.sinh(math.pi * (1 - 2 * ytile / exp_zoom)))
+    lat_deg = math.degrees(lat_rad)
+    return lat_deg, lon_deg
+
+
+@functools.lru_cache(maxsize=None)
+def _get_image_cache_dir() -> str:
+    """
+    Get the folder tile images are cached in, creating it if it doesn't exist
+    (this only needs working out once)
+
+    :return: The path to the image cache folder
+    """
+
+    # get the app data path and add the image cache folder on
+    app_data_path = user_data_dir("GPX Analysis", 'edf1101')
+    image_cache_dir = os.path.join(app_data_path, 'image_cache')
+
+    # create the image cache if it doesn't already exist
+    os.makedirs(image_cache_dir, exist_ok=True)
+
+    return image_cache_dir
+
+
+# The acceptable filetypes of the old one file per tile cache and how preferred each one is
+# (lowest wins) if a tile has more than one
+_CACHE_ENDING_RANKS = {'jpg': 0, 'jpeg': 1, 'png': 2}
+
+# Guards the tile database and cache index since tiles are looked up and downloaded
+# from several threads
+_CACHE_LOCK = threading.Lock()
+
+# Tiles fetched since the last time they were written to the database, as (zoom, x, y, data)
+_PENDING_TILES = []
+
+
+@functools.lru_cache(maxsize=None)
+def _get_tile_db() -> sqlite3.Connection:
+    """
+    Open the tile database (all the cached tiles live in one sqlite file), creating it
+    if it doesn't exist
+
+    :return: The database connection
+    """
+    tile_db = sqlite3.connect(os.path.join(_get_image_cache_dir(), 'tiles.sqlite'),
+                              check_same_thread=False)  # the lock handles thread safety
+    with tile_db:
+        tile_db.execute('CREATE TABLE IF NOT EXISTS tiles (z INTEGER, x INTEGER, y INTEGER, '
+                        'data BLOB, PRIMARY KEY (z, x, y)) WITHOUT ROWID')
+    return tile_db
+
+
+def _store_pending_tiles() -> None:
+    """
+    Write all the tiles fetched since last time into the database in one transaction
+
+    :return: None
+    """
+    with _CACHE_LOCK:
+        if not _PENDING_TILES:
+            return
+
+        tile_db = _get_tile_db()
+        with tile_db:
+            tile_db.executemany('INSERT OR REPLACE INTO tiles (z, x, y, data) VALUES (?, ?, ?, ?)',
+                                _PENDING_TILES)
+        _PENDING_TILES.clear()
+
+
+# so tiles fetched outside get_images_async don't get lost when the program closes
+atexit.register(_store_pending_tiles)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_cache_index() -> dict[tuple[int, int, int], str]:
+    """
+    Scan the old image cache folder once and index every tile file in it,
+    so looking up a tile doesn't have to stat the disk for each filetype
+
+    :return: dict of (zoom, x, y) tile index to the path of its cached image
+    """
+    image_cache_dir = _get_image_cache_dir()
+
+    cache_index = {}
+    ranks = {}  # how preferred the filetype we've indexed for each tile is
+    with os.scandir(image_cache_dir) as entries:
+        for entry in entries:
+            stem, f_type = os.path.splitext(entry.name)
+            f_type = f_type[1:]
+            parts = stem.split('-')  # the files are named zoom-y-x.filetype
+            rank = _CACHE_ENDING_RANKS.get(f_type)
+            if rank is None or len(parts) != 3 or not all(part.isdigit() for part in parts):
+                continue
+
+            key = (int(parts[0]), int(parts[2]), int(parts[1]))
+            if key not in ranks or rank < ranks[key]:
+                ranks[key] = rank
+                cache_index[key] = entry.path
+
+    return cache_index
+
+
+def _is_image(data: bytes) -> bool:
+    """
+    Check some bytes are actually an image (only reads the headers, doesn't decode it)
+
+    :param data: The raw image bytes
+    :return: Whether it is an image
+    """
+    try:
+        with PIL.Image.open(io.BytesIO(data)) as img:
+            img.verify()
+    except (OSError, SyntaxError, ValueError):  # what PIL raises for broken or non image data
+        return False
+    return True
+
+
+def _forget_tile(zoom: int, x_coord: int, y_coord: int) -> None:
+    """
+    Remove a tile from the cache database, so it gets downloaded again next time
+
+    :param zoom: The zoom tile index
+    :param x_coord: The x tile index
+    :param y_coord: The y tile index
+    :return: None
+    """
+    with _CACHE_LOCK:
+        tile_db = _get_tile_db()
+        with tile_db:
+            tile_db.execute('DELETE FROM tiles WHERE z = ? AND x = ? AND y = ?',
+                            (zoom, x_coord, y_coord))
+
+
+class LazyTile:
+    """
+    A map tile that is only decoded the first time its pixels are needed
+    """
+
+    def __init__(self, source: str | bytes, cache_key: tuple[int, int, int] | None = None):
+        """
+        Set up the tile
+
+        :param source: The path to the cached image file or the raw downloaded image bytes
+        :param cache_key: The (zoom, x, y) of its row in the cache database if it came from there
+        """
+        self.__source = source
+        self.__cache_key = cache_key
+        self.__array = None
+        self.__broken = False
+
+    def is_broken(self) -> bool:
+        """
+        Whether decoding the tile has already failed
+
+        :return: True if the tile couldn't be decoded
+        """
+        return self.__broken
+
+    def to_array(self) -> np.ndarray:
+        """
+        Decode the tile (only the first time) and return its pixels
+
+        :return: The tile image as a uint8 array
+        """
+        if self.__broken:  # don't keep trying to decode it
+            raise OSError('Tile image is broken')
+
+        if self.__array is None:
+            source = self.__source
+            if isinstance(source, bytes):
+                source = io.BytesIO(source)
+            try:
+                with PIL.Image.open(source) as img:
+                    self.__array = np.ascontiguousarray(img, dtype=np.uint8)
+            except OSError:
+                # a broken cached tile, drop it from the cache so it gets downloaded again
+                self.__broken = True
+                self.__source = None
+                if self.__cache_key is not None:
+                    _forget_tile(*self.__cache_key)
+                raise
+            self.__source = None  # the decoded array is all we need now
+
+        return self.__array
+
+
+def _try_cache(x_coord: int, y_coord: int, zoom: int):
+    """
+    Get the image for a tile from the cache
+
+    :param x_coord: The x tile index
+    :param y_coord: The y tile index
+    :param zoom: The zoom tile index
+    :return: The (undecoded) image or None if it isn't cached
+    """
+    with _CACHE_LOCK:
+        row = _get_tile_db().execute('SELECT data FROM tiles WHERE z = ? AND x = ? AND y = ?',
+                                     (zoom, x_coord, y_coord)).fetchone()
+        if row is not None:
+            return LazyTile(row[0], cache_key=(zoom, x_coord, y_coord))
+
+        # Not in the database, it might still be a file from the old cache so move it over
+        path = _get_cache_index().get((zoom, x_coord, y_coord))
+
+    if path is None:
+        return None
+
+    with open(path, 'rb') as file:
+        data = file.read()
+    if not _is_image(data):  # a broken old file, so just download it again
+        return None
+    with _CACHE_LOCK:
+        _PENDING_TILES.append((zoom, x_coord, y_coord, data))
+
+    return LazyTile(data)
+
+
+def _download(x_coord: int, y_coord: int, zoom: int):
+    """
+    Download the image for a tile and queue it to be saved into the cache
+
+    :param x_coord: The x tile index
+    :param y_coord: The y tile index
+    :param zoom: The zoom tile index
+    :return: The (undecoded) image
+    """
+    image_url = _URL_TMPL.format(zoom, y_coord, x_coord)
+    response = _POOL.request("GET", image_url, timeout=10.0)
+    if response.status != 200:
+        raise urllib3.exceptions.HTTPError(f'Tile download failed with status {response.status}')
+
+    # make sure it really is a tile, and not eg. an error page, before caching it
+    if not _is_image(response.data):
+        raise urllib3.exceptions.HTTPError('Tile download did not return an image')
+
+    # Keep exactly what the server sent rather than re-encoding it
+    with _CACHE_LOCK:
+        _PENDING_TILES.append((zoom, x_coord, y_coord, response.data))
+
+    return LazyTile(response.data)
+
+
+# Keep recently used tiles in memory (decoded once they've been shown) so overlapping
+# tracks don't re-read the disk. Ordered oldest use first so the oldest can be dropped
+_MEMORY_TILE_LIMIT = 512
+_MEMORY_TILES = OrderedDict()
+
+
+def get_img(x_coord: int, y_coord: int, zoom: int):
+    """
+    Get the image from the tile either from memory, the disk cache or downloading
+
+    :param x_coord: The x tile index
+    :param y_coord: The y tile index
+    :param zoom: The zoom tile index
+    :return: The image
+    """
+    key = (zoom, x_coord, y_coord)
+    with _CACHE_LOCK:
+        img = _MEMORY_TILES.get(key)
+        if img is not None and not img.is_broken():  # broken ones get fetched again
+            _MEMORY_TILES.move_to_end(key)
+            return img
+
+    img = _try_cache(x_coord, y_coord, zoom)
+
+    if img is None:  # Otherwise download it and cache
+        img = _download(x_coord, y_coord, zoom)
+
+    with _CACHE_LOCK:
+        _MEMORY_TILES[key] = img
+        _MEMORY_TILES.move_to_end(key)
+        if len(_MEMORY_TILES) > _MEMORY_TILE_LIMIT:
+            _MEMORY_TILES.popitem(last=False)
+
+    return img
+
+
+async def _get_img_async(tile_index: tuple[int, int], zoom: int):
+    """
+    Get the image for a tile without blocking the event loop
+
+    :param tile_index: The (x, y) tile index to get
+    :param zoom: The zoom tile index
+    :return: The image, or the network error if it couldn't be fetched
+    """
+    try:
+        # loading/downloading is blocking so run it on the download threads
+        return await asyncio.get_running_loop().run_in_executor(
+            _DOWNLOAD_EXECUTOR, get_img, tile_index[0], tile_index[1], zoom)
+    except (urllib3.exceptions.HTTPError, OSError) as exc:
+        return exc  # only network/file problems are expected, anything else is a real bug
+
+
+async def get_images_async(tile_indexes: list[tuple[int, int]],
+                           zoom: int) -> dict[tuple, LazyTile]:
+    """
+    Get the images for a collection of tiles, fetching them all concurrently
+
+    :param tile_indexes: The (x, y) tile indexes to get
+    :param zoom: The zoom tile index
+    :return: The collection of images as a dict key = image pos, value = image
+    """
+    if not tile_indexes:
+        return {}
+
+    # the download executor caps how many are in flight at once
+    images = await asyncio.gather(*[_get_img_async(tile, zoom) for tile in tile_indexes])
+
+    # save everything new to the cache in one go, rather than a transaction per tile
+    await asyncio.to_thread(_store_pending_tiles)
+
+    # One failed tile shouldn't stop the rest of the map loading, it's just left blank
+    tiles = {tile: img for tile, img in zip(tile_indexes, images)
+             if not isinstance(img, Exception)}
+
+    # but if none of them came back then there's no map at all, so report why
+    if not tiles:
+        raise next(img for img in images if isinstance(img, Exception))
+
+    return tiles
+
+
+def _tile_indexes_near_track(track: gpx.Track) -> list[tuple[int, int]]:
+    """
+    Get the tile indexes within a small radius of any point on the track
+
+    :param track: The track to find the tiles near
+    :return: The (x, y) tile indexes
+    """
+
+    radius = 1
+
+    tile_indexes = set()  # the tile indexes we have found
+
+    all_track_points = track.get_track_points()  # all the points we'll iterate through
+
+    for point in all_track_points:
+        pos = point.get_position_degrees()  # the point's degrees value
+        tile_ind = deg2num(pos[0], pos[1], 17)
+
+        # Look in a radius around this point
+        for x_pos in range(tile_ind[0] - radius, tile_ind[0] + radius + 1):
+            for y_pos in range(tile_ind[1] - radius, tile_ind[1] + radius + 1):
+
+                # skip this position if we have already found it
+                if (x_pos, y_pos) in tile_indexes:
+                    continue
+
+                # check its within a smooth radius
+                mag_sqr = pow(x_pos - tile_ind[0], 2) + pow(y_pos - tile_ind[1], 2)
+                if mag_sqr > pow(radius + 0.5, 2):
+                    continue
+
+                tile_indexes.add((x_pos, y_pos))
+
+    return list(tile_indexes)
+
+
+async def get_all_images_near_track_async(track: gpx.Track) -> dict[tuple, LazyTile]:
+    """
+    More Tile server friendly way of getting images, by only fetching the ones near the track
+
+    :param track: The track to get images of nearby
+    :return: The collection of images as a dict key = image pos, value = image
+    """
+    return await get_images_async(_tile_indexes_near_track(track), 17)